@@ -1,10 +1,16 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from fastapi.responses import Response
 
-from app.services.waqi_service import fetch_realtime_aqi
+from app.services.waqi_service import fetch_bounds_aqi, fetch_realtime_aqi
 
 router = APIRouter(prefix="/api/v1/realtime-aqi", tags=["Realtime AQI"])
 
+# Built once at import; a tuple keeps the display order and is shared read-only across requests
+POPULAR_CITIES = ("Delhi", "Mumbai", "London", "New York")
+
+# Bounding box (lat1, lon1, lat2, lon2) covering India, matching the frontend map extent
+INDIA_BOUNDS = (6.7, 68.1, 37.5, 97.4)
+
 @router.get("/city/{city_name}")
 async def get_city_aqi(city_name: str):
     """
@@ -14,7 +20,10 @@ async def get_city_aqi(city_name: str):
     return {"status": "success", "city": city_name, "data": data}
 
 @router.get("/coordinates")
-async def get_coordinates_aqi(latitude: float, longitude: float):
+async def get_coordinates_aqi(
+    latitude: float = Query(..., ge=-90, le=90, description="Latitude in decimal degrees"),
+    longitude: float = Query(..., ge=-180, le=180, description="Longitude in decimal degrees")
+):
     """
     Fetch real-time AQI data based on coordinates via WAQI.
     """
@@ -24,7 +33,7 @@ async def get_coordinates_aqi(latitude: float, longitude: float):
 
 @router.get("/popular-cities")
 async def get_popular_cities():
-    return {"status": "success", "data": ["Delhi", "Mumbai", "London", "New York"]}
+    return {"status": "success", "data": POPULAR_CITIES}
 
 @router.get("/history/{city}")
 async def get_history(city: str, days: int = 7):
@@ -32,7 +41,11 @@ async def get_history(city: str, days: int = 7):
 
 @router.get("/nationwide")
 async def get_nationwide_heatmap():
-    return {"status": "success", "data": [{"lat": 28.6, "lon": 77.2, "aqi": 150}]}
+    """
+    Fetch AQI for every WAQI station in India with a single map/bounds request.
+    """
+    stations = await fetch_bounds_aqi(*INDIA_BOUNDS)
+    return {"status": "success", "data": stations}
 
 @router.get("/search")
 async def search_location(q: str):
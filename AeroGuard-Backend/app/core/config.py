@@ -25,7 +25,12 @@ class Settings(BaseSettings):
         return v
     
     # Operational Settings
+    ENVIRONMENT: str = "development"
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    WEB_CONCURRENCY: int = 1  # Worker processes in production; each loads the ML artifacts
     MODEL_CACHE_TIMEOUT: int = 3600
+    WAQI_CACHE_TTL: int = 90  # Seconds to reuse a WAQI response; 0 disables caching
     LOG_LEVEL: str = "INFO"
     MAX_REQUEST_SIZE: int = 1048576  # 1MB default
 
@@ -1,12 +1,26 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
+from app.services import waqi_service
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open pooled upstream connections on the serving event loop
+    waqi_service.open_client()
+    yield
+    # Release pooled upstream connections on shutdown
+    await waqi_service.close_client()
 
 # Initialize the FastAPI application
 app = FastAPI(
     title="AeroGuard API",
     description="Hyper-Local Air Quality & Health Risk Forecaster",
-    version="2.0.0"
+    version="2.0.0",
+    # Serialize JSON responses with orjson (C implementation) instead of stdlib json
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS using settings
@@ -14,12 +14,15 @@ ARTIFACT_DIR = os.path.join(BASE_ML_DIR, "artifacts")
 
 # Global Variables
 pipeline_config = {}
+pipeline_targets = []  # Resolved once from pipeline_config at load time
 ensemble_weights = {}
 scaler_X = None
 scaler_y = None
+scalers_unfitted = False  # Set at load time when a scaler lacks n_features_in_
 model_xgboost = None
 model_lstm = None
 models_sarima = {}  # Dictionary to hold SARIMA models per target
+sarima_forecasts = {}  # Memoized one-step SARIMA forecast per target
 
 def safe_load_keras_model(model_path):
     """
@@ -36,13 +39,19 @@ def safe_load_keras_model(model_path):
 
 def _load_artifacts():
 
-    global pipeline_config, ensemble_weights, scaler_X, scaler_y
+    global pipeline_config, pipeline_targets, ensemble_weights, scaler_X, scaler_y, scalers_unfitted
     global model_xgboost, model_lstm, models_sarima
     
     try:
         # Load configs
         with open(os.path.join(ARTIFACT_DIR, "pipeline_config.json"), "r") as f:
             pipeline_config = json.load(f)
+
+        # Resolve TARGETS once so inference does not re-derive them per request
+        # Support both 'TARGETS' (list) and 'target' (string) for flexibility
+        pipeline_targets = pipeline_config.get("TARGETS", [])
+        if not pipeline_targets and "target" in pipeline_config:
+            pipeline_targets = [pipeline_config["target"]]
             
         with open(os.path.join(ARTIFACT_DIR, "ensemble_weights.json"), "r") as f:
             ensemble_weights = json.load(f)
@@ -52,6 +61,12 @@ def _load_artifacts():
         print(f"DEBUG: scaler_X loaded: {scaler_X is not None}")
         scaler_y = joblib.load(os.path.join(ARTIFACT_DIR, "scaler_y.joblib"))
         print(f"DEBUG: scaler_y loaded: {scaler_y is not None}")
+
+        # Check scaler fitness once here rather than on every inference call;
+        # generate_ensemble_forecast raises on the recorded result
+        scalers_unfitted = not hasattr(scaler_X, "n_features_in_") or not hasattr(scaler_y, "n_features_in_")
+        if scalers_unfitted:
+            print("CRITICAL ERROR: Loaded scalers appear to be unfitted. Check if scaler_X.joblib and scaler_y.joblib are valid fitted objects.")
         
         # Load XGBoost (.joblib) and LSTM (.keras) models
         model_xgboost = joblib.load(os.path.join(ARTIFACT_DIR, "xgb_model.joblib"))
@@ -65,13 +80,8 @@ def _load_artifacts():
 
 
         
-        # Load SARIMA models iteratively based on TARGETS or target
-        # Support both 'TARGETS' (list) and 'target' (string) for flexibility
-        targets = pipeline_config.get("TARGETS", [])
-        if not targets and "target" in pipeline_config:
-            targets = [pipeline_config["target"]]
-            
-        for target in targets:
+        # Load SARIMA models iteratively based on the resolved targets
+        for target in pipeline_targets:
             # Try both sarima_{target}.pkl and sarima_model.pkl (fallback)
             paths_to_try = [
                 os.path.join(ARTIFACT_DIR, f"sarima_AQI.pkl"),
@@ -101,8 +111,9 @@ async def generate_ensemble_forecast(features: list) -> dict:
     """
     Executes inference across LSTM, XGBoost, and SARIMA models for multi-pollutant targets.
     Scales inputs, inverse-transforms outputs, and calculates weighted ensemble predictions.
+    Accepts the lookback window as nested lists or as a float64 NumPy array.
     """
-    global scaler_X, scaler_y, pipeline_config, ensemble_weights, model_xgboost, model_lstm, models_sarima
+    global scaler_X, scaler_y, scalers_unfitted, pipeline_config, pipeline_targets, ensemble_weights, model_xgboost, model_lstm, models_sarima, sarima_forecasts
 
     if scaler_X is None or scaler_y is None:
         raise HTTPException(status_code=503, detail="ML scalers failed to load. Check server artifacts.")
@@ -113,31 +124,25 @@ async def generate_ensemble_forecast(features: list) -> dict:
     if model_lstm is None:
         raise HTTPException(status_code=503, detail="LSTM model failed to load. Please check artifacts/lstm_model.keras.")
 
-
-
-    # Safety check: Ensure scalers are fitted before calling transform/inverse_transform
-
-    if not hasattr(scaler_X, "n_features_in_") or not hasattr(scaler_y, "n_features_in_"):
+    # Safety check: Ensure scalers are fitted before calling transform/inverse_transform (checked at load time)
+    if scalers_unfitted:
         raise ValueError("Loaded scalers appear to be unfitted. Check if scaler_X.joblib and scaler_y.joblib are valid fitted objects.")
 
 
-    # Support both 'TARGETS' (list) and 'target' (string)
-    targets = pipeline_config.get("TARGETS", [])
-    if not targets and "target" in pipeline_config:
-        targets = [pipeline_config["target"]]
-        
+    # Targets are resolved from 'TARGETS' (list) or 'target' (string) at load time
+    targets = pipeline_targets
     if not targets:
         raise ValueError("Pipeline configuration is missing TARGETS list or 'target' key.")
 
 
     # 1. Convert features to a Pandas DataFrame to maintain feature names and avoid warnings
-    # Input 'features' is expected to be a 2D array of shape (7, 11)
+    # Input 'features' is expected to be a 2D array of shape (7, 11). It is converted to a
+    # float64 array once (a no-op for callers already passing one), and the DataFrame wraps
+    # that block instead of re-parsing the nested Python lists
+    X_raw = np.asarray(features, dtype=np.float64)
     feature_names = pipeline_config.get("feature_cols", [])
-    if not feature_names:
-        # Fallback to numpy if names are missing
-        X_raw = np.array(features)
-    else:
-        X_raw = pd.DataFrame(features, columns=feature_names)
+    if feature_names:
+        X_raw = pd.DataFrame(X_raw, columns=feature_names)
     
     # Scale directly on the 2D array/DataFrame (7 rows x 11 features)
     X_scaled = scaler_X.transform(X_raw)
@@ -171,10 +176,13 @@ async def generate_ensemble_forecast(features: list) -> dict:
         # 5. Run inference on SARIMA
         sarima_val = 0.0
         if target in models_sarima:
-            sarima_model = models_sarima[target]
-            sarima_pred_raw = sarima_model.forecast(steps=1)
-            # SARIMA natively returns unscaled values if fit on raw targets
-            sarima_val = float(sarima_pred_raw.iloc[0] if hasattr(sarima_pred_raw, "iloc") else sarima_pred_raw[0])
+            # The one-step forecast depends only on the fitted model, not on the request
+            # features, so it is computed once per target and reused across requests
+            if target not in sarima_forecasts:
+                sarima_pred_raw = models_sarima[target].forecast(steps=1)
+                # SARIMA natively returns unscaled values if fit on raw targets
+                sarima_forecasts[target] = float(sarima_pred_raw.iloc[0] if hasattr(sarima_pred_raw, "iloc") else sarima_pred_raw[0])
+            sarima_val = sarima_forecasts[target]
             
         # Extract specific dynamic weights for this target
         target_weights = ensemble_weights.get(target, {"lstm": 0.33, "xgboost": 0.33, "sarima": 0.34})
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import List
 
 class BriefingResponse(BaseModel):
@@ -12,5 +12,11 @@ class ExplainForecastRequest(BaseModel):
     trend: str = Field(..., description="Trend of the AQI, e.g., 'rising', 'falling', 'stable'")
     factors: List[str] = Field(..., description="List of factors affecting the AQI")
 
+    @field_validator("factors")
+    @classmethod
+    def deduplicate_factors(cls, v: List[str]) -> List[str]:
+        # Drop repeated factors (keeping first-seen order) so they are not sent to the model twice
+        return list(dict.fromkeys(v))
+
 class ExplainForecastResponse(BaseModel):
     explanation: str
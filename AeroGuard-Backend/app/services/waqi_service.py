@@ -1,7 +1,119 @@
+import time
 import httpx
+import orjson
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import quote
 from fastapi import HTTPException
 from app.core.config import settings
 
+WAQI_BASE_URL = "https://api.waqi.info"
+_FEED_PREFIX = WAQI_BASE_URL + "/feed/"
+_BOUNDS_PREFIX = WAQI_BASE_URL + "/map/bounds/?latlng="
+
+# Shared client so keep-alive connections (and their TLS sessions) to WAQI are
+# pooled and reused across requests instead of reconnecting on every call.
+# It is opened from the app lifespan so its connections belong to the serving event loop.
+_client: Optional[httpx.AsyncClient] = None
+
+def open_client() -> None:
+    """
+    Create the shared WAQI HTTP client. Called on application startup.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+
+# Short-lived cache of WAQI 'data' payloads: {key: (expires_at, data)}. Keys are
+# 'city:'/'geo:' for feed lookups (dict payloads) and 'bounds:' for map/bounds (station lists)
+_CACHE_MAX_ENTRIES = 1024
+_cache: Dict[str, Tuple[float, Union[dict, list]]] = {}
+
+def _cache_get(key: str) -> Optional[Union[dict, list]]:
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def _cache_set(key: str, data: Union[dict, list]) -> None:
+    now = time.monotonic()
+    if len(_cache) >= _CACHE_MAX_ENTRIES:
+        # Drop expired entries first; if the cache is still full, start over
+        for stale_key in [k for k, (expires_at, _) in _cache.items() if expires_at <= now]:
+            del _cache[stale_key]
+        if len(_cache) >= _CACHE_MAX_ENTRIES:
+            _cache.clear()
+    _cache[key] = (now + settings.WAQI_CACHE_TTL, data)
+
+async def close_client() -> None:
+    """
+    Close the shared WAQI HTTP client. Called on application shutdown.
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def _get_api_key() -> str:
+    api_key = getattr(settings, "REALTIME_AQI_API_KEY", None)
+    if not api_key:
+        raise HTTPException(status_code=500, detail="WAQI API Key not configured.")
+    return api_key
+
+async def _get_waqi_data(url: str, cache_key: str) -> Union[dict, list]:
+    """
+    GET a WAQI endpoint and return its 'data' payload, caching successful responses.
+    
+    Args:
+        url (str): Fully built WAQI URL including the token.
+        cache_key (str): Key for the short-lived response cache.
+        
+    Returns:
+        dict | list: The 'data' payload from the WAQI JSON response (a list of stations
+                     for map/bounds queries).
+    """
+    # WAQI stations update roughly hourly, so serve repeated lookups from the cache
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        if _client is not None:
+            response = await _client.get(url)
+        else:
+            # Outside the app lifespan (e.g. scripts), use a one-off client bound to the caller's loop
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                response = await client.get(url)
+        response.raise_for_status()
+        
+        # Decode the raw body with orjson rather than httpx's stdlib-json response.json()
+        data = orjson.loads(response.content)
+        
+        # WAQI returns 200 OK even for errors, so we explicitly check the body payload
+        if data.get("status") == "error":
+            raise HTTPException(
+                status_code=404,
+                detail=f"WAQI Error: {data.get('data', 'Unknown station or location not found')}"
+            )
+            
+        payload = data.get("data", {})
+        if settings.WAQI_CACHE_TTL > 0:
+            _cache_set(cache_key, payload)
+        return payload
+            
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to WAQI API: {str(e)}"
+        )
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"WAQI API returned an HTTP error: {str(e)}"
+        )
+
 async def fetch_realtime_aqi(city: str = None, lat: float = None, lon: float = None) -> dict:
     """
     Fetch real-time AQI and meteorological data from the WAQI API.
@@ -14,42 +126,49 @@ async def fetch_realtime_aqi(city: str = None, lat: float = None, lon: float = N
     Returns:
         dict: The 'data' payload from the WAQI JSON response.
     """
-    api_key = getattr(settings, "REALTIME_AQI_API_KEY", None)
-    if not api_key:
-        raise HTTPException(status_code=500, detail="WAQI API Key not configured.")
+    api_key = _get_api_key()
         
     if lat is not None and lon is not None:
         feed = f"geo:{lat};{lon}"
+        # ~100m rounding so nearby lookups resolve to the same station entry
+        cache_key = f"geo:{lat:.3f};{lon:.3f}"
     elif city:
         feed = city
+        cache_key = f"city:{city.strip().lower()}"
     else:
         raise HTTPException(status_code=400, detail="Either city or coordinates must be provided.")
 
-    url = f"https://api.waqi.info/feed/{feed}/?token={api_key}"
+    # Escape the feed so city names containing '/', '?' or '#' stay inside the path segment
+    url = _FEED_PREFIX + quote(feed, safe=":;") + "/?token=" + api_key
+    return await _get_waqi_data(url, cache_key)
+
+async def fetch_bounds_aqi(lat1: float, lon1: float, lat2: float, lon2: float) -> list:
+    """
+    Fetch every WAQI station inside a bounding box with a single map/bounds request,
+    instead of one feed request per city.
     
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=10.0)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # WAQI returns 200 OK even for errors, so we explicitly check the body payload
-            if data.get("status") == "error":
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"WAQI Error: {data.get('data', 'Unknown station or location not found')}"
-                )
-                
-            return data.get("data", {})
-            
-    except httpx.RequestError as e:
-        raise HTTPException(
-            status_code=503,
-            detail=f"Failed to connect to WAQI API: {str(e)}"
-        )
-    except httpx.HTTPStatusError as e:
-        raise HTTPException(
-            status_code=e.response.status_code,
-            detail=f"WAQI API returned an HTTP error: {str(e)}"
-        )
+    Args:
+        lat1 (float): Latitude of the first corner.
+        lon1 (float): Longitude of the first corner.
+        lat2 (float): Latitude of the opposite corner.
+        lon2 (float): Longitude of the opposite corner.
+        
+    Returns:
+        list: Stations as dicts with 'station', 'lat', 'lon' and integer 'aqi'.
+              Stations currently reporting no AQI ('-') are skipped.
+    """
+    api_key = _get_api_key()
+    latlng = f"{lat1},{lon1},{lat2},{lon2}"
+    url = _BOUNDS_PREFIX + latlng + "&token=" + api_key
+    stations = await _get_waqi_data(url, f"bounds:{latlng}")
+
+    return [
+        {
+            "station": station.get("station", {}).get("name"),
+            "lat": station["lat"],
+            "lon": station["lon"],
+            "aqi": int(station["aqi"])
+        }
+        for station in stations
+        if str(station.get("aqi", "")).isdigit()
+    ]
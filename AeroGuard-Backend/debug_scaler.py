@@ -2,8 +2,9 @@ import joblib
 import os
 import sys
 
-# Define absolute path to artifacts
-BASE_DIR = r"c:\Users\MSUSERSL123\Desktop\New folder\AeroGuard-Deploy\AeroGuard-Backend\app\ml\artifacts"
+# Resolve artifacts relative to this script (mirrors ARTIFACT_DIR in app/ml/inference.py
+# without importing it, which would load TensorFlow and every model)
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app", "ml", "artifacts")
 SCALER_PATH = os.path.join(BASE_DIR, "scaler_y.joblib")
 
 print(f"--- Artifact Integrity Check ---")
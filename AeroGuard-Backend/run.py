@@ -0,0 +1,27 @@
+import uvicorn
+from app.core.config import settings
+
+def main() -> int:
+    """
+    Start the AeroGuard API server.
+
+    In production the reloader is disabled and uvicorn runs a pool of worker
+    processes (WEB_CONCURRENCY, default 1 since each worker loads the ML artifacts).
+    Otherwise a single auto-reloading process is started for local development.
+    """
+    if settings.ENVIRONMENT.lower() == "production":
+        uvicorn.run(
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            workers=settings.WEB_CONCURRENCY,
+            log_level=settings.LOG_LEVEL.lower(),
+            proxy_headers=True,
+        )
+        return 0
+
+    uvicorn.run("app.main:app", host=settings.HOST, port=settings.PORT, reload=True)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -26,7 +26,7 @@ def print_failure(msg: str):
 
 def test_health_risk(client: httpx.Client):
     print(f"\n{CYAN}--- Test 1: Health Risk Logic ---{RESET}")
-    url = f"{BASE_URL}/api/v1/health-risk/"
+    url = "/api/v1/health-risk/"
     params = {"aqi": 145, "persona": "Children / Elderly"}
     
     try:
@@ -45,7 +45,7 @@ def test_health_risk(client: httpx.Client):
 
 def test_ml_forecasting(client: httpx.Client):
     print(f"\n{CYAN}--- Test 2: ML Forecasting Ensemble ---{RESET}")
-    url = f"{BASE_URL}/api/v1/forecast/"
+    url = "/api/v1/forecast/"
     
     # Create a dummy payload matching ForecastRequest schema (a 2D list of floats).
     # Shape logic depends on your specific model, assuming 24 timesteps by 15 features here.
@@ -71,8 +71,8 @@ def test_ml_forecasting(client: httpx.Client):
 def test_waqi_realtime(client: httpx.Client):
     print(f"\n{CYAN}--- Test 3: WAQI Realtime Service ---{RESET}")
     # Corrected target URL to point to the specific city endpoint defined in realtime.py
-    # Targeted absolute URL: prefix '/api/v1/realtime-aqi' + route '/city/{city_name}'
-    url = f"{BASE_URL}/api/v1/realtime-aqi/city/Mumbai"
+    # Targeted path (relative to BASE_URL): prefix '/api/v1/realtime-aqi' + route '/city/{city_name}'
+    url = "/api/v1/realtime-aqi/city/Mumbai"
     
     try:
         response = client.get(url, timeout=10.0)
@@ -87,9 +87,32 @@ def test_waqi_realtime(client: httpx.Client):
     except Exception as e:
         print_failure(f"Connection Error: {e}")
 
+def test_waqi_nationwide(client: httpx.Client):
+    print(f"\n{CYAN}--- Test 3b: WAQI Nationwide Stations (map/bounds) ---{RESET}")
+    # Targeted path (relative to BASE_URL): prefix '/api/v1/realtime-aqi' + route '/nationwide'
+    url = "/api/v1/realtime-aqi/nationwide"
+    
+    try:
+        response = client.get(url, timeout=10.0)
+        if response.status_code == 200:
+            data = response.json()
+            stations = data.get("data")
+            if data.get("status") == "success" and isinstance(stations, list) and stations:
+                station = stations[0]
+                if all(key in station for key in ("station", "lat", "lon", "aqi")):
+                    print_success(f"Endpoint returned 200 OK with {len(stations)} WAQI stations.")
+                else:
+                    print_failure(f"Station entry missing station/lat/lon/aqi keys. Got: {station}")
+            else:
+                print_failure(f"Unexpected response structure. Got: {data}")
+        else:
+            print_failure(f"Expected 200 OK, got {response.status_code}. Response: {response.text}")
+    except Exception as e:
+        print_failure(f"Connection Error: {e}")
+
 def test_ai_briefing(client: httpx.Client):
     print(f"\n{CYAN}--- Test 4: AI Explainability - Briefing ---{RESET}")
-    url = f"{BASE_URL}/api/v1/ai/briefing"
+    url = "/api/v1/ai/briefing"
     params = {"city": "Mumbai", "persona": "Outdoor Workers / Athletes"}
     
     try:
@@ -108,7 +131,7 @@ def test_ai_briefing(client: httpx.Client):
 
 def test_ai_forecast_explanation(client: httpx.Client):
     print(f"\n{CYAN}--- Test 5: AI Explainability - Forecast ---{RESET}")
-    url = f"{BASE_URL}/api/v1/ai/explain-forecast"
+    url = "/api/v1/ai/explain-forecast"
     payload = {
         "aqi_value": 120,
         "trend": "rising",
@@ -133,20 +156,22 @@ def main():
     print(f"{YELLOW}    AeroGuard Backend Integration Tests       {RESET}")
     print(f"{YELLOW}=============================================={RESET}")
     
-    # Verify the backend server is actually running before executing the suite
-    try:
-        with httpx.Client() as client:
-            client.get(f"{BASE_URL}/")
-    except httpx.ConnectError:
-        print(f"\n{RED}CRITICAL ERROR: Could not connect to {BASE_URL}.{RESET}")
-        print(f"Please ensure you have started the FastAPI server (e.g., using 'uvicorn app.main:app --reload').\n")
-        sys.exit(1)
-        
-    # Execute the Test Suite synchronously
-    with httpx.Client() as client:
+    # One client for the liveness check and the whole suite, so the connection to the
+    # server is opened once and reused instead of reconnecting per test
+    with httpx.Client(base_url=BASE_URL) as client:
+        # Verify the backend server is actually running before executing the suite
+        try:
+            client.get("/")
+        except httpx.ConnectError:
+            print(f"\n{RED}CRITICAL ERROR: Could not connect to {BASE_URL}.{RESET}")
+            print(f"Please ensure you have started the FastAPI server (e.g., using 'uvicorn app.main:app --reload').\n")
+            sys.exit(1)
+
+        # Execute the Test Suite synchronously
         test_health_risk(client)
         test_ml_forecasting(client)
         test_waqi_realtime(client)
+        test_waqi_nationwide(client)
         test_ai_briefing(client)
         test_ai_forecast_explanation(client)
         